@@ -1,4 +1,6 @@
-from PySide6.QtCore import QTimer
+from bisect import bisect_left
+from functools import cached_property
+from operator import mul
 
 from smurfsniper.ui.overlays import Overlay
 
@@ -11,6 +13,21 @@ TREND_SYMBOLS: dict[str, str] = {
     "unknown": "?",
 }
 
+# |slope| (MMR per game) above which a trend is moderate / strong; a slope
+# exactly on a cutoff falls into the weaker bucket.
+_TREND_CUTOFFS = (0.4, 1.5)
+_RISING_TRENDS = ("flat", "rising", "strong rising")
+_FALLING_TRENDS = ("flat", "falling", "strong falling")
+
+# Win/loss windows rendered straight from summary() keys with format_map.
+PERF_BLOCK = (
+    "1d {Wins (1d)}W/{Losses (1d)}L   "
+    "3d {Wins (3d)}W/{Losses (3d)}L\n"
+    "7d {Wins (7d)}W/{Losses (7d)}L   "
+    "30d {Wins (30d)}W/{Losses (30d)}L\n"
+    "LFT {Lifetime Wins}W/{Lifetime Losses}L"
+)
+
 POSITION_MAP = {
     "center": "center",
     "top_left": "top_left",
@@ -21,6 +38,13 @@ POSITION_MAP = {
 
 
 class BaseAnalysis:
+    """Shared scoring for player and team analyses.
+
+    Derived values that walk the match history are ``cached_property``s: an
+    analysis is built per game from data that does not change, while the
+    summary and overlay builders read the same values several times.
+    """
+
     @property
     def match_history(self):
         raise NotImplementedError
@@ -28,6 +52,10 @@ class BaseAnalysis:
     def summary(self) -> dict:
         raise NotImplementedError
 
+    def _overlay_summary(self) -> dict:
+        """The summary entries the overlay renders; read-only."""
+        return self.summary()
+
     def _overlay_top_details(self, summary: dict) -> list[str]:
         raise NotImplementedError
 
@@ -38,88 +66,106 @@ class BaseAnalysis:
         return TREND_SYMBOLS.get(self.mmr_trend, "?")
 
     def sparkline(self, days: int = 7) -> str:
-        mh = self.match_history
-        if not mh:
-            return ""
-        return mh.sparkline(days=days)
-
-    @property
+        cache = self._sparklines
+        if days not in cache:
+            mh = self.match_history
+            cache[days] = mh.sparkline(days=days) if mh else ""
+        return cache[days]
+
+    @cached_property
+    def _sparklines(self) -> dict[int, str]:
+        """Per-instance ``days -> sparkline`` memo; each overlay asks twice."""
+        return {}
+
+    @cached_property
     def first_game_played(self):
         mh = self.match_history
         return mh.first_game_played if mh else None
 
-    @property
+    @cached_property
     def last_game_played(self):
         mh = self.match_history
         return mh.last_game_played if mh else None
 
-    @property
+    @cached_property
     def mmr_trend(self) -> str:
         mh = self.match_history
         if not mh or len(mh.ratings) < 5:
             return "unknown"
 
+        # Least-squares slope against x = 0..n-1, using the closed forms
+        # sum((x - mean_x)**2) = n(n²-1)/12 and
+        # sum((x - mean_x)(y - mean_y)) = sum(x*y) - (n-1)/2 * sum(y).
         y = mh.ratings[-100:]
         n = len(y)
-        x = range(n)
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
-
-        num = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
-        den = sum((xi - mean_x) ** 2 for xi in x)
-        if den == 0:
-            return "unknown"
+        num = sum(map(mul, range(n), y)) - (n - 1) * sum(y) / 2
+        den = n * (n * n - 1) / 12
 
         slope = num / den
-        if slope > 1.5:
-            return "strong rising"
-        if slope > 0.4:
-            return "rising"
-        if slope < -1.5:
-            return "strong falling"
-        if slope < -0.4:
-            return "falling"
-        return "flat"
+        labels = _RISING_TRENDS if slope > 0 else _FALLING_TRENDS
+        return labels[bisect_left(_TREND_CUTOFFS, abs(slope))]
 
     @property
     def wins_last_day(self):
-        return self.match_history.wins_last_day
+        return self._perf["Wins (1d)"]
 
     @property
     def losses_last_day(self):
-        return self.match_history.losses_last_day
+        return self._perf["Losses (1d)"]
 
     @property
     def wins_last_3_days(self):
-        return self.match_history.wins_last_3_days
+        return self._perf["Wins (3d)"]
 
     @property
     def losses_last_3_days(self):
-        return self.match_history.losses_last_3_days
+        return self._perf["Losses (3d)"]
 
     @property
     def wins_last_week(self):
-        return self.match_history.wins_last_week
+        return self._perf["Wins (7d)"]
 
     @property
     def losses_last_week(self):
-        return self.match_history.losses_last_week
+        return self._perf["Losses (7d)"]
 
     @property
     def wins_last_month(self):
-        return self.match_history.wins_last_month
+        return self._perf["Wins (30d)"]
 
     @property
     def losses_last_month(self):
-        return self.match_history.losses_last_month
+        return self._perf["Losses (30d)"]
 
     @property
     def wins_lifetime(self):
-        return self.match_history.wins_lifetime
+        return self._perf["Lifetime Wins"]
 
     @property
     def losses_lifetime(self):
-        return self.match_history.losses_lifetime
+        return self._perf["Lifetime Losses"]
+
+    @cached_property
+    def _perf(self) -> dict:
+        """All ten win/loss summary entries from a single history lookup."""
+        h = self.match_history
+        w1, l1 = h.record(1)
+        w3, l3 = h.record(3)
+        w7, l7 = h.record(7)
+        w30, l30 = h.record(30)
+        wl, ll = h.record(-1)
+        return {
+            "Wins (1d)": w1,
+            "Losses (1d)": l1,
+            "Wins (3d)": w3,
+            "Losses (3d)": l3,
+            "Wins (7d)": w7,
+            "Losses (7d)": l7,
+            "Wins (30d)": w30,
+            "Losses (30d)": l30,
+            "Lifetime Wins": wl,
+            "Lifetime Losses": ll,
+        }
 
     @property
     def account_age_days(self) -> int:
@@ -148,16 +194,10 @@ class BaseAnalysis:
 
     def _resolve_overlay_layout(self, orientation: str):
         """Returns layout blocks based on user-configured orientation."""
-        summary = self.summary()
+        summary = self._overlay_summary()
 
         top_block = "\n".join(self._overlay_top_details(summary))
-        perf_block = (
-            f"1d {summary['Wins (1d)']}W/{summary['Losses (1d)']}L   "
-            f"3d {summary['Wins (3d)']}W/{summary['Losses (3d)']}L\n"
-            f"7d {summary['Wins (7d)']}W/{summary['Losses (7d)']}L   "
-            f"30d {summary['Wins (30d)']}W/{summary['Losses (30d)']}L\n"
-            f"LFT {summary['Lifetime Wins']}W/{summary['Lifetime Losses']}L"
-        )
+        perf_block = PERF_BLOCK.format_map(summary)
         side_block = self._overlay_side_panel(summary)
 
         if orientation == "vertical":
@@ -182,12 +222,4 @@ class BaseAnalysis:
         for row in rows:
             ov.add_row(row, style=Overlay.PLAYER_STYLE, spacing=12)
 
-        if delay_seconds <= 0:
-            ov.show()
-            return
-
-        def delayed_show():
-            ov.show()
-
-        delay_ms = int(delay_seconds * 1000)
-        QTimer.singleShot(delay_ms, delayed_show)
+        ov.show_after(delay_seconds)
@@ -17,10 +17,9 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QTimer
-
 from smurfsniper.api import cross_network
 from smurfsniper.logger import logger
 from smurfsniper.models.config import OverlayPreferences
@@ -78,7 +77,7 @@ def _current_streak(matches: List[RecentMatch]) -> str:
     if not matches:
         return ""
     # matches come newest-first from SC2Pulse; guard by sorting on date desc.
-    ordered = sorted(matches, key=lambda m: m.date, reverse=True)
+    ordered = sorted(matches, key=attrgetter("date"), reverse=True)
     first = ordered[0].decision
     if first not in ("WIN", "LOSS"):
         return ""
@@ -302,11 +301,7 @@ def show_hint_overlay(prefs: OverlayPreferences) -> None:
     ov.position = prefs.position
     ov.add_row([HINT_TEXT], style=Overlay.TM_STYLE, spacing=12)
 
-    delay = prefs.seconds_delay_before_show
-    if delay <= 0:
-        ov.show()
-        return
-    QTimer.singleShot(int(delay * 1000), ov.show)
+    ov.show_after(prefs.seconds_delay_before_show)
 
 
 def render_overlay(
@@ -331,8 +326,4 @@ def render_overlay(
         spacing=12,
     )
 
-    delay = prefs.seconds_delay_before_show
-    if delay <= 0:
-        ov.show()
-        return
-    QTimer.singleShot(int(delay * 1000), ov.show)
+    ov.show_after(prefs.seconds_delay_before_show)
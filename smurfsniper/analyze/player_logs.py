@@ -1,31 +1,54 @@
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
-from typing import List, Tuple
+from functools import cached_property
+from typing import List, NamedTuple, Tuple
 
-from pydantic import BaseModel, ConfigDict
-from PySide6.QtCore import QTimer
+from pydantic import BaseModel
 
 from smurfsniper.models.player_log import PlayerLog
 from smurfsniper.ui.overlays import Overlay
 
+# The opponent's logged match_status, seen from my side.
+_OUTCOME_MAP = {
+    "victory": "loss",
+    "defeat": "win",
+    "tie": "tie",
+}
 
-class PlayerLogAnalysis(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    logs: List[PlayerLog]
+class LoggedEncounter(NamedTuple):
+    """The ``PlayerLog`` columns this analysis reads."""
+
+    name: str
+    region: str
+    created_at: datetime
+    match_status: str
+
+
+class PlayerLogAnalysis(BaseModel):
+    logs: List[LoggedEncounter]
 
     @classmethod
     def from_battlenet_id(cls, battlenet_id: int, limit: int = 40):
-        rows = list(
-            PlayerLog.select()
+        query = (
+            PlayerLog.select(
+                PlayerLog.name,
+                PlayerLog.region,
+                PlayerLog.created_at,
+                PlayerLog.match_status,
+            )
             .where(PlayerLog.battlenet_id == battlenet_id)
             .order_by(PlayerLog.created_at.desc())
             .limit(limit)
+            .tuples()
         )
+        rows = [LoggedEncounter._make(row) for row in query]
         if not rows:
             raise ValueError("No PlayerLog entries found")
-        return cls(logs=rows)
+        # Rows come straight from our own table; skip re-validating them.
+        return cls.model_construct(logs=rows)
 
     @property
     def name(self) -> str:
@@ -45,30 +68,14 @@ class PlayerLogAnalysis(BaseModel):
         first = self.logs[0]
         return first.created_at, first.match_status
 
-    @staticmethod
-    def _map_to_me(status: str) -> str:
-        return {
-            "victory": "loss",
-            "defeat": "win",
-            "tie": "tie",
-        }[status]
-
     @property
     def times_played(self) -> int:
         return len(self.logs)
 
-    @property
+    @cached_property
     def record_vs_me(self) -> Tuple[int, int, int]:
-        wins = losses = ties = 0
-        for log in self.logs:
-            outcome = self._map_to_me(log.match_status)
-            if outcome == "win":
-                wins += 1
-            elif outcome == "loss":
-                losses += 1
-            else:
-                ties += 1
-        return wins, losses, ties
+        c = Counter(_OUTCOME_MAP[log.match_status] for log in self.logs)
+        return c["win"], c["loss"], c["tie"]
 
     def summary(self) -> dict:
         wins, losses, ties = self.record_vs_me
@@ -84,12 +91,7 @@ class PlayerLogAnalysis(BaseModel):
         }
 
     def _top_block(self) -> str:
-        return "\n".join(
-            [
-                f"{self.name} ({self.region})",
-                f"Played {self.times_played} times",
-            ]
-        )
+        return f"{self.name} ({self.region})\nPlayed {self.times_played} times"
 
     def _record_block(self) -> str:
         wins, losses, ties = self.record_vs_me
@@ -127,12 +129,4 @@ class PlayerLogAnalysis(BaseModel):
         else:
             ov.add_row(blocks, style=Overlay.PLAYER_STYLE, spacing=12)
 
-        if delay_seconds <= 0:
-            ov.show()
-            return
-
-        def delayed_show():
-            ov.show()
-
-        delay_ms = int(delay_seconds * 1000)
-        QTimer.singleShot(delay_ms, delayed_show)
+        ov.show_after(delay_seconds)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from itertools import islice
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, PrivateAttr
-from PySide6.QtCore import QTimer
+from pydantic import BaseModel
 
-from smurfsniper.analyze import BaseAnalysis
+from smurfsniper.analyze import PERF_BLOCK, BaseAnalysis
 from smurfsniper.api import sc2pulse
 from smurfsniper.enums import League, RaceCode, TeamFormat
 from smurfsniper.models.match import (
@@ -19,25 +21,26 @@ from smurfsniper.models.player import Player, PlayerStats
 from smurfsniper.ui.overlays import Overlay
 from smurfsniper.utils import human_friendly_duration
 
-_TREND_SYMBOLS: Dict[str, str] = {
-    "strong rising": "▲▲",
-    "rising": "▲",
-    "falling": "▼",
-    "strong falling": "▼▼",
-    "flat": "→",
-    "unknown": "?",
-}
 
+# Single-line variant of PERF_BLOCK for the compact per-player HUD block.
+_PERF_LINE = PERF_BLOCK.replace("\n", "   ")
 
-def _trend_symbol(trend: str) -> str:
-    return _TREND_SYMBOLS.get(trend, "?")
 
+@dataclass(slots=True)
+class Teammate:
+    """How often, and how recently, a partner shared a team with the player."""
 
-def _sparkline_for(player_analysis: "PlayerAnalysis", days: int = 7) -> str:
-    hist = player_analysis.player_stats.match_history
-    if not hist:
-        return ""
-    return hist.sparkline(days=days)
+    count: int
+    last_played: datetime
+
+
+def _latest(a: Optional[datetime], b: Optional[datetime]) -> Optional[datetime]:
+    """Later of two optional datetimes (None when both are missing)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a if a >= b else b
 
 
 def _top_teammate_rows(
@@ -46,14 +49,10 @@ def _top_teammate_rows(
     include_games: bool = False,
 ) -> List[str]:
     rows: List[str] = []
-    for idx, (name, info) in enumerate(p.teammates.items()):
-        if idx >= limit:
-            break
-        ts = info.get("last_played")
-        ts_str = ts.isoformat() if isinstance(ts, datetime) else "unknown"
+    for name, info in islice(p.teammates.items(), limit):
+        ts_str = info.last_played.isoformat()
         if include_games:
-            games = info.get("count", 0)
-            rows.append(f"{name:<12} {games:>2}g  {ts_str}")
+            rows.append(f"{name:<12} {info.count:>2}g  {ts_str}")
         else:
             rows.append(f"{name:<14} {ts_str}")
     return rows or ["(none)"]
@@ -63,9 +62,6 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
     current_race: Optional[str] = None
     player_stats: PlayerStats
 
-    _latest_team_cache: Any = PrivateAttr(default=None)
-    _latest_team_loaded: bool = PrivateAttr(default=False)
-
     @property
     def match_history(self):
         return self.player_stats.match_history
@@ -85,9 +81,7 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
 
     @classmethod
     def from_player(cls, player: Player) -> "PlayerAnalysis":
-        best_match = player.get_player_stats()
-        stats = PlayerStats.model_validate(best_match)
-        return cls(player_stats=stats)
+        return cls(player_stats=player.get_player_stats())
 
     @classmethod
     def from_player_stats(
@@ -96,7 +90,11 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
         current_race = "Unknown"
         if player and player.race is not None:
             current_race = RaceCode.from_alias(player.race).name
-        return cls(player_stats=player_stats, current_race=current_race)
+        # player_stats is already a validated model (this is the per-game
+        # service path), so skip re-running field validation.
+        return cls.model_construct(
+            player_stats=player_stats, current_race=current_race
+        )
 
     @property
     def name(self) -> str:
@@ -121,26 +119,18 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
     def total_games(self) -> int:
         return self.player_stats.totalGamesPlayed
 
-    @property
+    @cached_property
     def _latest_team(self):
         """Most-recently-played team record, or None. Cached per instance."""
-        if self._latest_team_loaded:
-            return self._latest_team_cache
-        teams = list(self.player_stats.members.character.teams)
+        teams = self.player_stats.members.character.teams
         # Prefer 1v1 ladder teams so league/rank reflect solo play; fall back
         # to any team if the player has no 1v1 record.
         solo = [t for t in teams if t.queueType == TeamFormat._1V1.value]
-        pool = solo or teams
-        latest = None
-        newest = ""
-        for t in pool:
-            stamp = t.lastPlayed or ""
-            if latest is None or stamp > newest:
-                latest = t
-                newest = stamp
-        self._latest_team_cache = latest
-        self._latest_team_loaded = True
-        return latest
+        return max(
+            solo or teams,
+            key=lambda t: t.lastPlayed or datetime.min,
+            default=None,
+        )
 
     @property
     def activity_rate(self) -> float:
@@ -181,6 +171,7 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
         beaten = team.globalTeamCount - team.globalRank
         return round(100 * beaten / team.globalTeamCount, 1)
 
+    @cached_property
     def _tier_band(self) -> Optional[tuple[int, int, int]]:
         """(tier_index, lo, hi) MMR band for the player's current 1v1 league.
 
@@ -213,7 +204,7 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
         league = self.current_league
         if not league:
             return None
-        band = self._tier_band()
+        band = self._tier_band
         if band is None:
             return league.title()
         return f"{league.title()} {band[0] + 1}"
@@ -221,12 +212,12 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
     @property
     def mmr_to_promotion(self) -> Optional[int]:
         """MMR needed to reach the next tier up (top of the current band)."""
-        band = self._tier_band()
+        band = self._tier_band
         if band is None or self.current_mmr is None:
             return None
         return max(band[2] - self.current_mmr, 0)
 
-    @property
+    @cached_property
     def live_stream(self) -> Optional[dict]:
         """The player's currently-live stream record, or None.
 
@@ -345,12 +336,12 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
             parts.append(f"${self.pro_earnings:,}")
         return " · ".join(parts) or None
 
-    @property
+    @cached_property
     def recent_matches(self) -> List[RecentMatch]:
         """Recent ranked-ladder matches (CUSTOM / co-op excluded)."""
         return ladder_only(self.player_stats.recent_matches())
 
-    @property
+    @cached_property
     def map_records(self) -> Dict[str, tuple[int, int]]:
         return map_records(self.recent_matches)
 
@@ -379,17 +370,17 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
             return None
         ordered = sorted(records.items(), key=lambda kv: -(kv[1][0] + kv[1][1]))
         return " · ".join(
-            f"{name} {wins}-{losses}" for name, (wins, losses) in ordered[:3]
+            [f"{name} {wins}-{losses}" for name, (wins, losses) in ordered[:3]]
         )
 
-    @property
+    @cached_property
     def most_played_race(self) -> str:
-        races = self.player_stats.members.raceGames
-        if not races:
+        key = self.player_stats.members.top_race
+        if key is None:
             return "unknown"
-        key = max(races, key=lambda r: races.get(r, 0))
         return RaceCode[key].name
 
+    @cached_property
     def _smurf_assessment(self) -> tuple[int, List[str]]:
         """Graded smurf likelihood (0-100) with human-readable reasons.
 
@@ -403,17 +394,17 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
         score = 0
         reasons: List[str] = []
 
-        w3, l3 = h.wins_last_3_days, h.losses_last_3_days
+        w3, l3 = h.record(3)
         if (w3 + l3) >= 5 and (w3 / (w3 + l3)) >= 0.80:
             score += 35
             reasons.append(f"3d winrate {w3}/{w3 + l3} ≥80%")
 
-        w7, l7 = h.wins_last_week, h.losses_last_week
+        w7, l7 = h.record(7)
         if (w7 + l7) >= 8 and (w7 / (w7 + l7)) >= 0.75:
             score += 25
             reasons.append(f"7d winrate {w7}/{w7 + l7} ≥75%")
 
-        wl, ll = h.wins_lifetime, h.losses_lifetime
+        wl, ll = h.record(-1)
         if (wl + ll) >= 30 and (wl / (wl + ll)) >= 0.70:
             score += 15
             reasons.append("lifetime winrate ≥70%")
@@ -440,15 +431,15 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
 
     @property
     def smurf_score(self) -> int:
-        return self._smurf_assessment()[0]
+        return self._smurf_assessment[0]
 
     @property
     def smurf_reasons(self) -> List[str]:
-        return self._smurf_assessment()[1]
+        return self._smurf_assessment[1]
 
-    @property
+    @cached_property
     def smurf_warning(self) -> Optional[str]:
-        score, reasons = self._smurf_assessment()
+        score, reasons = self._smurf_assessment
         if score >= 70:
             label = "⚠️ Likely Smurf"
         elif score >= 45:
@@ -461,19 +452,15 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
         detail = f" - {reasons[0]}" if reasons else ""
         return f"{label} ({score}/100){detail}"
 
-    @property
-    def teammates(self) -> Dict[str, Dict[str, Optional[datetime]]]:
-        result = {}
+    @cached_property
+    def teammates(self) -> Dict[str, Teammate]:
         my_name = self.name
         if not self.match_history:
             return {}
 
+        result: Dict[str, Teammate] = {}
         for team in self.player_stats.members.character.teams:
-            ts = (
-                datetime.fromisoformat(team.lastPlayed.replace("Z", ""))
-                if team.lastPlayed
-                else None
-            )
+            ts = team.lastPlayed
             if not ts:
                 continue
 
@@ -482,28 +469,27 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
                 if n == my_name:
                     continue
 
-                entry = result.setdefault(n, {"count": 0, "last_played": None})
-                entry["count"] += 1
-                if entry["last_played"] is None or ts > entry["last_played"]:
-                    entry["last_played"] = ts
+                entry = result.get(n)
+                if entry is None:
+                    result[n] = Teammate(count=1, last_played=ts)
+                    continue
+                entry.count += 1
+                if ts > entry.last_played:
+                    entry.last_played = ts
 
         return result
 
     def summary(self) -> dict:
+        """Full stat summary. Built once per instance (the overlay, 2v2 wrapper
+        and service log all ask for it); callers get their own shallow copy."""
+        return {**self._summary, "Frequent Teammates": self._teammates_summary}
+
+    @cached_property
+    def _summary(self) -> dict:
+        """Every summary entry except the teammate table, which the overlays
+        never read (their side panel uses ``_top_teammate_rows``)."""
         first = self.first_game_played
 
-        partners_readable = {
-            name: {
-                "last_played": (
-                    info["last_played"].isoformat()
-                    if isinstance(info["last_played"], datetime)
-                    else "unknown"
-                ),
-                "games": info["count"],
-            }
-            for name, info in self.teammates.items()
-        }
-
         return {
             "Player": self.name,
             "Playing For": (
@@ -540,19 +526,22 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
             "Current Race": self.current_race,
             "Most Played Race": self.most_played_race,
             "Total Games": self.total_games,
-            "Wins (1d)": self.wins_last_day,
-            "Losses (1d)": self.losses_last_day,
-            "Wins (3d)": self.wins_last_3_days,
-            "Losses (3d)": self.losses_last_3_days,
-            "Wins (7d)": self.wins_last_week,
-            "Losses (7d)": self.losses_last_week,
-            "Wins (30d)": self.wins_last_month,
-            "Losses (30d)": self.losses_last_month,
-            "Lifetime Wins": self.wins_lifetime,
-            "Lifetime Losses": self.losses_lifetime,
-            "Frequent Teammates": partners_readable,
+            **self._perf,
+        }
+
+    @cached_property
+    def _teammates_summary(self) -> dict:
+        return {
+            name: {
+                "last_played": info.last_played.isoformat(),
+                "games": info.count,
+            }
+            for name, info in self.teammates.items()
         }
 
+    def _overlay_summary(self) -> dict:
+        return self._summary
+
     def _overlay_top_details(self, summary: dict) -> list[str]:
         trend = self.trend_symbol()
         spark = self.sparkline()
@@ -561,7 +550,7 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
         if summary["Current Race"] != summary["Most Played Race"]:
             race_note = f" (→ {summary['Most Played Race']})"
 
-        smurf = f"{summary['Smurf Warning']}" if summary["Smurf Warning"] else ""
+        smurf = summary["Smurf Warning"] or ""
 
         rows = [
             f"{summary['Player']} | {summary['Max League']}",
@@ -584,29 +573,30 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
         return rows
 
     def _overlay_side_panel(self, summary: dict) -> str:
-        return "\n".join(_top_teammate_rows(self, limit=3, include_games=True))
+        return self._teammates_block
 
     def overlay_block(self) -> str:
         """Compact HUD block showing league, MMR, race, smurf warning."""
-        s = self.summary()
-        trend = _trend_symbol(self.mmr_trend)
-        spark = _sparkline_for(self, days=7)
+        return self._overlay_block
+
+    @cached_property
+    def _overlay_block(self) -> str:
+        # Rendered once; the analysis is rebuilt for every game, so a re-show
+        # of the same instance always has the same text.
+        s = self._summary  # read-only here, so skip summary()'s copy
+        trend = self.trend_symbol()
+        spark = self.sparkline(days=7)
 
         race_note = ""
         if s["Current Race"] != s["Most Played Race"]:
             race_note = f"(→ {s['Most Played Race']})"
 
-        smurf = f"⚠ {self.smurf_warning}" if self.smurf_warning else ""
+        warn = s["Smurf Warning"]
+        smurf = f"⚠ {warn}" if warn else ""
         league = s.get("Max League", "")
         first_played = s.get("Playing For", "")
 
-        perf = (
-            f"1d {s['Wins (1d)']}W/{s['Losses (1d)']}L   "
-            f"3d {s['Wins (3d)']}W/{s['Losses (3d)']}L   "
-            f"7d {s['Wins (7d)']}W/{s['Losses (7d)']}L   "
-            f"30d {s['Wins (30d)']}W/{s['Losses (30d)']}L   "
-            f"LFT {s['Lifetime Wins']}W/{s['Lifetime Losses']}L"
-        )
+        perf = _PERF_LINE.format_map(s)
 
         lines = [
             f"{s['Player']}   {league}",
@@ -630,6 +620,10 @@ class PlayerAnalysis(BaseAnalysis, BaseModel):
 
     def overlay_teammates_block(self) -> str:
         """Compact teammates block for overlays."""
+        return self._teammates_block
+
+    @cached_property
+    def _teammates_block(self) -> str:
         return "\n".join(_top_teammate_rows(self, limit=3, include_games=True))
 
 
@@ -645,6 +639,7 @@ class Player2v2Analysis:
         self.p2 = p2
 
     def summary(self) -> dict:
+        # Each summary() is built once per player and cached; these are copies.
         s1 = self.p1.summary()
         s2 = self.p2.summary()
 
@@ -681,7 +676,7 @@ class Player2v2Analysis:
                 s2["Player"]: (s2["Current Race"], s2["Most Played Race"]),
             },
             "Combined Performance": combined,
-            "Most Recent Match": max(s1["Most Recent Game"], s2["Most Recent Game"]),
+            "Most Recent Match": _latest(s1["Most Recent Game"], s2["Most Recent Game"]),
             "Frequent Teammates": {
                 s1["Player"]: s1["Frequent Teammates"],
                 s2["Player"]: s2["Frequent Teammates"],
@@ -714,14 +709,4 @@ class Player2v2Analysis:
             ov.add_row([p1_tm], style=Overlay.TM_STYLE)
             ov.add_row([p2_tm], style=Overlay.TM_STYLE)
 
-        # No delay → show now
-        if delay_seconds <= 0:
-            ov.show()
-            return
-
-        # Delay using Qt timer
-        def delayed_show():
-            ov.show()
-
-        delay_ms = int(delay_seconds * 1000)
-        QTimer.singleShot(delay_ms, delayed_show)
+        ov.show_after(delay_seconds)
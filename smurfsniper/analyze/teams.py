@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from operator import itemgetter
+
 from pydantic import BaseModel
-from PySide6.QtCore import QTimer
 
-from smurfsniper.analyze import BaseAnalysis
+from smurfsniper.analyze import PERF_BLOCK, BaseAnalysis
 from smurfsniper.models.player import Player, PlayerStats
 from smurfsniper.models.team import Team
 from smurfsniper.ui.overlays import Overlay
@@ -34,14 +35,15 @@ class TeamAnalysis(BaseAnalysis, BaseModel):
 
     @classmethod
     def from_players_stats(cls, player_stats: list[PlayerStats]) -> "TeamAnalysis":
-        ids = sorted(ps.members.character.battlenetId for ps in player_stats)
-
-        found = []
-        for ps in player_stats:
-            for t in ps.members.character.teams:
-                tids = sorted(m.character.battlenetId for m in t.members)
-                if tids == ids:
-                    found.append(t)
+        ids = frozenset(ps.members.character.battlenetId for ps in player_stats)
+
+        found = [
+            t
+            for ps in player_stats
+            for t in ps.members.character.teams
+            if len(t.members) == len(ids)
+            and frozenset(m.character.battlenetId for m in t.members) == ids
+        ]
         if not found:
             raise NoTeamFound
         return cls(team=Team.merge(found))
@@ -88,21 +90,22 @@ class TeamAnalysis(BaseAnalysis, BaseModel):
         member_races = []
         for m in team.members:
             rg = m.raceGames or {}
-            best = max(rg, key=rg.get) if rg else "unknown"
+            best = max(rg.items(), key=itemgetter(1))[0] if rg else "unknown"
+            p, t, z, r = (
+                m.protossGamesPlayed,
+                m.terranGamesPlayed,
+                m.zergGamesPlayed,
+                m.randomGamesPlayed,
+            )
             member_races.append(
                 {
                     "name": m.character.name,
                     "primary_race": best,
-                    "protoss": m.protossGamesPlayed,
-                    "terran": m.terranGamesPlayed,
-                    "zerg": m.zergGamesPlayed,
-                    "random": m.randomGamesPlayed,
-                    "total_games": (
-                        (m.protossGamesPlayed or 0)
-                        + (m.terranGamesPlayed or 0)
-                        + (m.zergGamesPlayed or 0)
-                        + (m.randomGamesPlayed or 0)
-                    ),
+                    "protoss": p,
+                    "terran": t,
+                    "zerg": z,
+                    "random": r,
+                    "total_games": sum(filter(None, (p, t, z, r))),
                 }
             )
 
@@ -117,16 +120,7 @@ class TeamAnalysis(BaseAnalysis, BaseModel):
             "Current Rating": team.rating,
             "League": getattr(team.league, "name", str(team.league)),
             "Trend": self.mmr_trend,
-            "Wins (1d)": self.wins_last_day,
-            "Losses (1d)": self.losses_last_day,
-            "Wins (3d)": self.wins_last_3_days,
-            "Losses (3d)": self.losses_last_3_days,
-            "Wins (7d)": self.wins_last_week,
-            "Losses (7d)": self.losses_last_week,
-            "Wins (30d)": self.wins_last_month,
-            "Losses (30d)": self.losses_last_month,
-            "Lifetime Wins": self.wins_lifetime,
-            "Lifetime Losses": self.losses_lifetime,
+            **self._perf,
             "Region": team.region,
             "Division ID": team.divisionId,
             "Legacy ID": team.legacyId,
@@ -145,13 +139,7 @@ class TeamAnalysis(BaseAnalysis, BaseModel):
 
         top_block = "\n".join(self._overlay_top_details(summary))
 
-        perf_block = (
-            f"1d {summary['Wins (1d)']}W/{summary['Losses (1d)']}L   "
-            f"3d {summary['Wins (3d)']}W/{summary['Losses (3d)']}L\n"
-            f"7d {summary['Wins (7d)']}W/{summary['Losses (7d)']}L   "
-            f"30d {summary['Wins (30d)']}W/{summary['Losses (30d)']}L\n"
-            f"LFT {summary['Lifetime Wins']}W/{summary['Lifetime Losses']}L"
-        )
+        perf_block = PERF_BLOCK.format_map(summary)
 
         side_block = self._overlay_side_panel(summary)
 
@@ -171,13 +159,4 @@ class TeamAnalysis(BaseAnalysis, BaseModel):
             ov.add_row([perf_block], style=Overlay.PLAYER_STYLE)
             ov.add_row([side_block], style=Overlay.PLAYER_STYLE)
 
-        if delay_seconds <= 0:
-            ov.show()
-            return
-
-        # Delay the overlay via Qt timer
-        def delayed_show():
-            ov.show()
-
-        delay_ms = int(delay_seconds * 1000)
-        QTimer.singleShot(delay_ms, delayed_show)
+        ov.show_after(delay_seconds)
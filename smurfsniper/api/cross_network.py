@@ -14,9 +14,10 @@ is base-url-bound and is not reused here.
 from __future__ import annotations
 
 import re
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import httpx
+from pydantic import BaseModel, OnErrorOmit, TypeAdapter, ValidationError
 
 from smurfsniper.api import sc2pulse
 from smurfsniper.enums import Region
@@ -52,6 +53,24 @@ _liquipedia_client: Optional[httpx.Client] = None
 _social_client: Optional[httpx.Client] = None
 
 
+# The distinctiveness check only needs each candidate's character name, so the
+# /characters body is validated into these slim models straight from JSON;
+# stats, clan and race counters are skipped instead of built into dicts.
+class _CandidateCharacter(BaseModel):
+    name: Optional[str] = None
+
+
+class _CandidateMember(BaseModel):
+    character: Optional[_CandidateCharacter] = None
+
+
+class _Candidate(BaseModel):
+    members: Optional[_CandidateMember] = None
+
+
+_CANDIDATE_NAMES_ADAPTER = TypeAdapter(List[OnErrorOmit[_Candidate]])
+
+
 def _client(which: str) -> httpx.Client:
     global _aligulac_client, _liquipedia_client, _social_client
     if which == "aligulac":
@@ -118,16 +137,17 @@ def is_distinctive_name(name: str) -> bool:
     # Query by base name: SC2Pulse character names carry a ``#1234``
     # discriminator, and searching with it attached returns nothing.
     try:
-        candidates = sc2pulse.search_characters(name.split("#")[0].strip())
-    except sc2pulse.SC2PulseError as exc:
+        candidates = sc2pulse.search_characters_json(
+            name.split("#")[0].strip(), _CANDIDATE_NAMES_ADAPTER
+        )
+    except (sc2pulse.SC2PulseError, ValidationError) as exc:
         logger.warning(f"Distinctiveness check failed for {name!r}: {exc}")
         return False
 
     exact = 0
     for entry in candidates:
-        member = entry.get("members") if isinstance(entry, dict) else None
-        char = member.get("character") if isinstance(member, dict) else None
-        cand_name = char.get("name") if isinstance(char, dict) else None
+        char = entry.members.character if entry.members else None
+        cand_name = char.name if char else None
         if cand_name and _base_name(cand_name) == base:
             exact += 1
     return 0 < exact <= _MAX_EXACT_CANDIDATES
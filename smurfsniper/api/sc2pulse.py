@@ -1,27 +1,28 @@
 """Central client for the SC2Pulse API (https://sc2pulse.nephest.com).
 
-One pooled ``httpx.Client`` is shared across the process instead of opening a
-new connection per request. All calls go through ``_get`` which encodes query
-params, checks status, and retries transient failures (429 / 5xx / network
-errors) with exponential backoff. Errors surface as ``SC2PulseError`` so callers
-never have to know about httpx internals.
+One pooled ``httpx.Client`` (HTTP/2 where the server negotiates it) is shared
+across the process instead of opening a new connection per request. All calls
+go through ``_request`` which encodes query params, checks status, and retries
+transient failures (429 / 5xx / network errors) with exponential backoff.
+``_get`` decodes the body to Python objects; ``_get_bytes`` hands raw JSON to
+callers that validate it with pydantic directly. Errors surface as
+``SC2PulseError`` so callers never have to know about httpx internals.
 """
 
 from __future__ import annotations
 
 import random
+import threading
 import time
+from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Optional, Sequence, Tuple, TypeVar
 
 import httpx
+from pydantic import TypeAdapter
 
 from smurfsniper.logger import logger
-from smurfsniper.models.team_history import (
-    TeamHistory,
-    TeamHistoryData,
-    TeamHistoryPoint,
-)
+from smurfsniper.models.team_history import TeamHistory, TeamHistoryData
 
 BASE_URL = "https://sc2pulse.nephest.com/sc2/api"
 TIMEOUT = 25.0
@@ -30,6 +31,17 @@ BACKOFF_BASE = 0.5  # seconds; doubled each retry, plus jitter
 RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 _UID_BATCH = 10  # max team legacy UIDs per /team-histories request
 
+T = TypeVar("T")
+
+# Connection pool sizing. Every request goes to the same host, so a small
+# keep-alive pool lets back-to-back lookups (characters → teams → histories)
+# reuse warm TLS connections, including from the background scout thread.
+# With HTTP/2 the concurrent opponent lookups share streams on one connection
+# instead of each opening their own.
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 60.0  # seconds; outlives the 5s poll interval
+
 # Fixed params shared by every team-histories request.
 _HISTORY_PARAMS = [
     ("groupBy", "LEGACY_UID"),
@@ -48,25 +60,41 @@ class SC2PulseNotFound(SC2PulseError):
 
 
 _client: Optional[httpx.Client] = None
+# Lookups run from the Qt thread, the scout thread and worker pools; guard
+# lazy creation so concurrent first calls share one pool.
+_client_lock = threading.Lock()
 
 
 def _get_client() -> httpx.Client:
     global _client
-    if _client is None:
-        _client = httpx.Client(base_url=BASE_URL, timeout=TIMEOUT)
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                base_url=BASE_URL,
+                timeout=TIMEOUT,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
     return _client
 
 
 def close() -> None:
     """Close the shared client (e.g. on shutdown). Safe to call repeatedly."""
     global _client
-    if _client is not None:
-        _client.close()
-        _client = None
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
 
 
-def _get(path: str, params) -> list:
-    """GET ``path`` and return parsed JSON, retrying transient failures.
+def _request(path: str, params) -> httpx.Response:
+    """GET ``path`` and return the successful response, retrying transient failures.
 
     ``params`` is passed straight to httpx (dict or list of pairs) so values are
     URL-encoded. Raises ``SC2PulseError`` on non-retryable or exhausted failures.
@@ -91,10 +119,7 @@ def _get(path: str, params) -> list:
                     resp.raise_for_status()
                 except httpx.HTTPStatusError as exc:
                     raise SC2PulseError(str(exc)) from exc
-                try:
-                    return resp.json()
-                except ValueError as exc:
-                    raise SC2PulseError(f"Invalid JSON from {resp.url}") from exc
+                return resp
 
         if attempt < MAX_RETRIES - 1:
             delay = BACKOFF_BASE * (2 ** attempt) + random.uniform(0, BACKOFF_BASE)
@@ -107,14 +132,86 @@ def _get(path: str, params) -> list:
     raise SC2PulseError(f"SC2Pulse {path} failed after retries: {last_exc}")
 
 
-def search_characters(name: str) -> list:
-    """GET /characters?query=<name>. Returns raw character entries."""
-    return _get("/characters", {"query": name})
+def _get(path: str, params) -> list:
+    """GET ``path`` and return parsed JSON. See ``_request`` for retry/errors."""
+    resp = _request(path, params)
+    try:
+        return resp.json()
+    except ValueError as exc:
+        raise SC2PulseError(f"Invalid JSON from {resp.url}") from exc
+
+
+def _get_bytes(path: str, params) -> bytes:
+    """GET ``path`` and return the undecoded body.
+
+    For callers that validate straight from JSON bytes with a pydantic
+    ``TypeAdapter`` instead of building an intermediate list of dicts.
+    """
+    return _request(path, params).content
+
+
+# Short enough that a game-end lookup (e.g. the PlayerLog MMR) sees fresh
+# data rather than the game-start snapshot; long enough to share the body
+# between the lookups made for one opponent at game start.
+_CHARACTERS_TTL = 60.0  # seconds
+_CHARACTERS_CACHE_MAX = 128
+_characters_cache: Dict[str, Tuple[float, bytes]] = {}
+# Per-name fetch locks, so parallel lookups of one name share a single request.
+_characters_inflight: Dict[str, threading.Lock] = {}
+_characters_lock = threading.Lock()
+
+
+def _cached_characters_body(name: str) -> Optional[bytes]:
+    """Fresh cached /characters body for ``name``. Call with the lock held."""
+    hit = _characters_cache.get(name)
+    if hit is not None and time.monotonic() - hit[0] < _CHARACTERS_TTL:
+        return hit[1]
+    return None
+
 
+def search_characters_json(name: str, adapter: TypeAdapter[T]) -> T:
+    """GET /characters?query=<name>, validated from the JSON body by ``adapter``.
+
+    Bodies are cached per name for ``_CHARACTERS_TTL``, but only once they
+    validate, so a malformed or partial response is retried on the next call.
+    Concurrent misses for the same name wait on the first caller's request
+    instead of sending their own.
+    Raises ``pydantic.ValidationError`` for a body ``adapter`` rejects.
+    """
+    with _characters_lock:
+        body = _cached_characters_body(name)
+        if body is None:
+            name_lock = _characters_inflight.setdefault(name, threading.Lock())
+    if body is not None:
+        return adapter.validate_json(body)
+
+    with name_lock:
+        try:
+            # Another caller may have fetched the name while this one waited.
+            with _characters_lock:
+                body = _cached_characters_body(name)
+            if body is not None:
+                return adapter.validate_json(body)
 
-def character_teams(character_id: int) -> list:
-    """GET /character-teams?characterId=<id>. Returns raw team entries."""
-    return _get("/character-teams", {"characterId": character_id})
+            body = _get_bytes("/characters", {"query": name})
+            result = adapter.validate_json(body)
+
+            with _characters_lock:
+                # Re-insert so dict order stays oldest-first; evict only the oldest.
+                _characters_cache.pop(name, None)
+                if len(_characters_cache) >= _CHARACTERS_CACHE_MAX:
+                    del _characters_cache[next(iter(_characters_cache))]
+                _characters_cache[name] = (time.monotonic(), body)
+            return result
+        finally:
+            with _characters_lock:
+                if _characters_inflight.get(name) is name_lock:
+                    del _characters_inflight[name]
+
+
+def character_teams_json(character_id: int) -> bytes:
+    """GET /character-teams?characterId=<id>. Returns the undecoded JSON body."""
+    return _get_bytes("/character-teams", {"characterId": character_id})
 
 
 def character_links(character_id: int) -> list:
@@ -210,33 +307,33 @@ def parse_team_history(data, legacy_uid: str) -> Optional[TeamHistory]:
     """Merge a /team-histories response into a single deduped ``TeamHistory``.
 
     Reuses ``TeamHistoryData`` for parsing + TIMESTAMP/RATING length validation.
-    Returns ``None`` when there are no points.
+    Points are merged in one pass keyed by epoch timestamp; the first rating
+    seen for a timestamp wins. Returns ``None`` when there are no points.
     """
-    merged_points: List[TeamHistoryPoint] = []
+    points: Dict[int, int] = {}
 
     for entry in data:
         history = entry.get("history") if isinstance(entry, dict) else None
         if not history:
             continue
         try:
-            merged_points.extend(TeamHistoryData.model_validate(history).to_points())
+            parsed = TeamHistoryData.model_validate(history)
         except (ValueError, TypeError) as exc:
             logger.warning(f"Skipping malformed team-history entry: {exc}")
+            continue
+        for ts, rating in zip(parsed.TIMESTAMP, parsed.RATING):
+            points.setdefault(ts, rating)
 
-    if not merged_points:
+    if not points:
         return None
 
-    merged_points.sort(key=lambda p: p.timestamp)
-
-    deduped: List[TeamHistoryPoint] = []
-    last_ts = None
-    for p in merged_points:
-        if p.timestamp != last_ts:
-            deduped.append(p)
-            last_ts = p.timestamp
-
+    ordered = sorted(points)
     return TeamHistory(
         legacy_uid=legacy_uid,
-        timestamps=[p.timestamp for p in deduped],
-        ratings=[p.rating for p in deduped],
+        # Naive UTC, like every other datetime in the models.
+        timestamps=[
+            datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+            for ts in ordered
+        ],
+        ratings=[points[ts] for ts in ordered],
     )
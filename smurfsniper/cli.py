@@ -7,10 +7,9 @@ from typing import Any, Dict
 import click
 import yaml
 
-from smurfsniper import service
 from smurfsniper._version import __version__ as VERSION
 from smurfsniper.config_paths import resolve_config
-from smurfsniper.models.config import Config, Preferences
+from smurfsniper.models.config import Config, Preferences, load_yaml
 
 DEFAULT_URL = "http://localhost:6119/game"
 
@@ -22,8 +21,8 @@ def load_config(path: Path) -> Dict[str, Any]:
     if path.is_dir():
         raise click.ClickException(f"Config path is a directory: {path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    with path.open("rb") as f:
+        return load_yaml(f) or {}
 
 
 def apply_overrides(config: Dict[str, Any], overrides: list[str]) -> None:
@@ -84,10 +83,15 @@ def run_service(
     click.echo(f"Using SC2 game API: {url}")
     click.echo("Running service loop (ctrl+c to exit)")
 
+    # Imported here so validate/--dry-run/--version don't load Qt, the
+    # keyboard hook and the analysis/overlay stack.
+    from smurfsniper import service
+
     service.main(
         url=url,
         config_file_path=str(config_path),
         app=app,
+        config=config,
     )
 
 @click.group(
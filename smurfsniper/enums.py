@@ -21,18 +21,8 @@ class RaceCode(Enum):
 
         normalized = alias.strip().lower()
 
-        mapping = {
-            "terr": cls.TERRAN,
-            "terran": cls.TERRAN,
-            "prot": cls.PROTOSS,
-            "protoss": cls.PROTOSS,
-            "zerg": cls.ZERG,
-            "rand": cls.RANDOM,
-            "random": cls.RANDOM,
-        }
-
         try:
-            return mapping[normalized]
+            return _RACE_ALIASES[normalized]
         except KeyError:
             try:
                 return cls[alias.upper()]
@@ -40,6 +30,18 @@ class RaceCode(Enum):
                 raise ValueError(f"Unknown race alias: {alias!r}")
 
 
+# Built once at import; from_alias runs for every opponent lookup.
+_RACE_ALIASES: dict[str, RaceCode] = {
+    "terr": RaceCode.TERRAN,
+    "terran": RaceCode.TERRAN,
+    "prot": RaceCode.PROTOSS,
+    "protoss": RaceCode.PROTOSS,
+    "zerg": RaceCode.ZERG,
+    "rand": RaceCode.RANDOM,
+    "random": RaceCode.RANDOM,
+}
+
+
 class TeamFormat(Enum):
     _1V1 = 201
     _2V2 = 202
@@ -1,10 +1,13 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, ValidationError
 
 from smurfsniper.api import sc2pulse
 from smurfsniper.models.team import Team
 
+# Validates a whole /character-teams body in pydantic-core, no dict pass.
+_TEAM_LIST_ADAPTER = TypeAdapter(List[Team])
+
 
 class Character(BaseModel):
     realm: int
@@ -23,7 +26,12 @@ class Character(BaseModel):
         if self._team_cache is not None:
             return self._team_cache
 
-        data = sc2pulse.character_teams(self.id)
-        teams = [Team.model_validate(entry) for entry in data]
+        raw = sc2pulse.character_teams_json(self.id)
+        try:
+            teams = _TEAM_LIST_ADAPTER.validate_json(raw)
+        except ValidationError as exc:
+            raise sc2pulse.SC2PulseError(
+                f"Invalid /character-teams response for {self.id}: {exc}"
+            ) from exc
         self._team_cache = teams
         return teams
@@ -2,7 +2,17 @@ from pathlib import Path
 from typing import List, Optional
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+def load_yaml(stream):
+    """``yaml.safe_load`` on the libyaml-backed loader when it is available."""
+    return yaml.load(stream, Loader=_SafeLoader)
 
 
 class Me(BaseModel):
@@ -20,6 +30,9 @@ class Team(BaseModel):
 
 
 class OverlayPreferences(BaseModel):
+    # Frozen (and so hashable) so identical blocks can share one instance.
+    model_config = ConfigDict(frozen=True)
+
     visible: bool = True
     orientation: str = "horizontal"
     position: str = "top_center"
@@ -50,13 +63,21 @@ class Preferences(BaseModel):
     def from_yaml(cls, data: dict) -> "Preferences":
         external_cfg = data.get("external_overlay") or {}
         external = {"position": "top_center", **external_cfg}
+
+        # Copy-pasted blocks resolve to the same shared instance.
+        interned: dict[OverlayPreferences, OverlayPreferences] = {}
+
+        def overlay(block: dict) -> OverlayPreferences:
+            prefs = OverlayPreferences(**block)
+            return interned.setdefault(prefs, prefs)
+
         return cls(
-            overlay_1v1=OverlayPreferences(**data["1v1_overlay"]),
-            overlay_2v2=OverlayPreferences(**data["2v2_overlay"]),
-            overlay_team=OverlayPreferences(**data["team_overlay"]),
-            overlay_player_log_1=OverlayPreferences(**data["overlay_player_log_1"]),
-            overlay_player_log_2=OverlayPreferences(**data["overlay_player_log_2"]),
-            overlay_external=OverlayPreferences(**external),
+            overlay_1v1=overlay(data["1v1_overlay"]),
+            overlay_2v2=overlay(data["2v2_overlay"]),
+            overlay_team=overlay(data["team_overlay"]),
+            overlay_player_log_1=overlay(data["overlay_player_log_1"]),
+            overlay_player_log_2=overlay(data["overlay_player_log_2"]),
+            overlay_external=overlay(external),
         )
 
     def to_yaml_dict(self) -> dict:
@@ -99,8 +120,8 @@ class Config(BaseModel):
     @classmethod
     def from_config_file(cls, path: str | Path) -> "Config":
         path = Path(path)
-        with path.open("r") as f:
-            raw = yaml.safe_load(f)
+        with path.open("rb") as f:
+            raw = load_yaml(f)
 
         if "preferences" in raw:
             raw["preferences"] = Preferences.from_yaml(raw["preferences"])
@@ -1,6 +1,8 @@
+from functools import cached_property
+from operator import itemgetter
 from typing import Dict, List, Optional, Set
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, OnErrorOmit, TypeAdapter, ValidationError
 
 from smurfsniper.api import sc2pulse
 from smurfsniper.enums import League, RaceCode, Region, TeamFormat, TeamType
@@ -29,6 +31,17 @@ class Members(BaseModel):
     proTeam: Optional[str] = None
     proPlayer: Optional[Dict] = None
 
+    @cached_property
+    def top_race(self) -> Optional[str]:
+        """``raceGames`` key with the most games, or None when there are none.
+
+        Computed lazily (once) rather than in a validator so the many
+        discarded /characters candidates never pay for it.
+        """
+        if not self.raceGames:
+            return None
+        return max(self.raceGames.items(), key=itemgetter(1))[0]
+
 
 class PlayerStats(BaseModel):
     leagueMax: int
@@ -172,6 +185,11 @@ class PlayerStats(BaseModel):
         )
 
 
+# SC2Pulse returns some candidates with null core stats (e.g.
+# leagueMax/ratingMax); OnErrorOmit drops those instead of failing the list.
+_CANDIDATE_LIST_ADAPTER = TypeAdapter(List[OnErrorOmit[PlayerStats]])
+
+
 class Player(BaseModel):
     id: int
     name: str
@@ -196,20 +214,12 @@ class Player(BaseModel):
         )
 
     def matches(self) -> List[PlayerStats]:
-        data = sc2pulse.search_characters(self.name)
-
-        results: List[PlayerStats] = []
-        skipped = 0
-        for entry in data:
-            try:
-                results.append(PlayerStats.model_validate(entry))
-            except ValidationError:
-                # SC2Pulse returns some candidates with null core stats
-                # (e.g. leagueMax/ratingMax). Skip rather than crash.
-                skipped += 1
-        if skipped:
-            logger.debug(f"Skipped {skipped} unparseable candidate(s) for {self.name}")
-        return results
+        try:
+            return sc2pulse.search_characters_json(self.name, _CANDIDATE_LIST_ADAPTER)
+        except ValidationError as exc:
+            raise sc2pulse.SC2PulseError(
+                f"Invalid /characters response for {self.name}: {exc}"
+            ) from exc
 
     def get_player_stats(
         self,
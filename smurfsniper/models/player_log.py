@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from peewee import (CharField, Check, DateTimeField, IntegerField, Model,
@@ -11,7 +11,6 @@ APP_NAME = "smurfsniper"
 APP_AUTHOR = "smurfsniper"
 
 data_dir = Path(user_data_dir(APP_NAME, APP_AUTHOR))
-data_dir.mkdir(parents=True, exist_ok=True)
 
 db_path = data_dir / "player_log.sqlite3"
 
@@ -19,6 +18,10 @@ db = SqliteDatabase(
     db_path,
     pragmas={
         "journal_mode": "wal",
+        # Safe under WAL: a power loss can drop the last commit but never
+        # corrupts the file, and commits skip the per-write fsync.
+        "synchronous": "normal",
+        "temp_store": "memory",
         "cache_size": -64 * 1000,
         "foreign_keys": 1,
     },
@@ -31,7 +34,7 @@ class BaseModel(Model):
 
 
 class PlayerLog(BaseModel):
-    battlenet_id = IntegerField(index=True)
+    battlenet_id = IntegerField()
 
     name = CharField()
     realm = IntegerField()
@@ -48,6 +51,9 @@ class PlayerLog(BaseModel):
     class Meta:
         table_name = "player_log"
         order_by = ("-created_at",)
+        # Serves the per-opponent history read (battlenet_id, newest first)
+        # as one index seek with no sort.
+        indexes = ((("battlenet_id", "created_at"), False),)
 
     @classmethod
     def from_player(cls, player: Player, max_mmr: int, min_mmr: int, match_status: str):
@@ -89,7 +95,24 @@ class PlayerLog(BaseModel):
     def most_recent(cls):
         return cls.select().order_by(cls.id.desc()).first()
 
+    @classmethod
+    def most_recent_game_ids(cls) -> set[int]:
+        """battlenet_ids logged for the newest game.
+
+        A postgame's rows are written together, so every row within a minute
+        of the newest one belongs to the same game (games never end that
+        close together).
+        """
+        newest = cls.most_recent()
+        if newest is None:
+            return set()
+        since = newest.created_at - timedelta(minutes=1)
+        query = cls.select(cls.battlenet_id).where(cls.created_at >= since)
+        return {row.battlenet_id for row in query}
+
 
 def init_player_log_db() -> None:
+    # Created here rather than at import so importing the model does no I/O.
+    data_dir.mkdir(parents=True, exist_ok=True)
     db.connect(reuse_if_open=True)
     db.create_tables([PlayerLog])
@@ -1,15 +1,20 @@
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel
+# Plain slotted dataclasses: pydantic still validates them as PlayerStats
+# fields, but each of the many /characters candidates skips a per-instance
+# __dict__ for these small, read-only stat blocks.
 
 
-class PreviousStats(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PreviousStats:
     rating: Optional[int]
     gamesPlayed: Optional[int]
     rank: Optional[int]
 
 
-class CurrentStats(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CurrentStats:
     rating: Optional[int]
     gamesPlayed: Optional[int]
     rank: Optional[int]
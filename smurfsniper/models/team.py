@@ -1,6 +1,7 @@
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 from smurfsniper.api import sc2pulse
 from smurfsniper.models.team_history import TeamHistory
@@ -103,9 +104,10 @@ class Team(BaseModel):
     regionRank: Optional[int] = None
     leagueRank: Optional[int] = None
 
-    lastPlayed: Optional[str] = None
-    joined: Optional[str] = None
-    primaryDataUpdated: Optional[str] = None
+    # Parsed once at validation time (SC2Pulse sends ISO-8601 with a "Z").
+    lastPlayed: Optional[datetime] = None
+    joined: Optional[datetime] = None
+    primaryDataUpdated: Optional[datetime] = None
 
     members: List[TeamMember]
 
@@ -121,18 +123,27 @@ class Team(BaseModel):
 
     _match_history_cache: Optional[TeamHistory] = None
 
+    @field_validator("lastPlayed", "joined", "primaryDataUpdated")
+    @classmethod
+    def _naive_utc(cls, v: Optional[datetime]) -> Optional[datetime]:
+        # Match the naive-UTC datetimes used everywhere else (TeamHistory).
+        if v is not None and v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
     @classmethod
     def merge(cls, teams: List["Team"]) -> "Team":
         if not teams:
             raise ValueError("No teams provided for merge")
 
         most_recent = max(
-            teams, key=lambda t: t.lastPlayed or t.primaryDataUpdated or t.joined or ""
+            teams,
+            key=lambda t: (
+                t.lastPlayed or t.primaryDataUpdated or t.joined or datetime.min
+            ),
         )
 
-        first_joined = min(
-            [team for team in teams if team.joined], key=lambda t: t.joined
-        ).joined
+        first_joined = min(team.joined for team in teams if team.joined)
 
         total_wins = sum(t.wins for t in teams)
         total_losses = sum(t.losses for t in teams)
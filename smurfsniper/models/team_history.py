@@ -1,21 +1,15 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from functools import cached_property
+from operator import sub
 from statistics import pstdev
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, computed_field, field_validator
 
 
-class TeamHistoryPoint(BaseModel):
-    timestamp: datetime
-    rating: int
-
-    @classmethod
-    def from_raw(cls, ts: int, rating: int) -> "TeamHistoryPoint":
-        return cls(timestamp=datetime.utcfromtimestamp(ts), rating=rating)
-
-
 class TeamStaticData(BaseModel):
     LEGACY_ID: str
 
@@ -31,12 +25,6 @@ class TeamHistoryData(BaseModel):
             raise ValueError("TIMESTAMP and RATING must have same length")
         return v
 
-    def to_points(self) -> List[TeamHistoryPoint]:
-        return [
-            TeamHistoryPoint.from_raw(ts, rating)
-            for ts, rating in zip(self.TIMESTAMP, self.RATING)
-        ]
-
 
 class TeamHistory(BaseModel):
     legacy_uid: str
@@ -44,25 +32,40 @@ class TeamHistory(BaseModel):
     ratings: List[int]
 
     @computed_field
-    @property
+    @cached_property
     def mmr_deltas(self) -> List[int]:
-        return [
-            self.ratings[i] - self.ratings[i - 1] for i in range(1, len(self.ratings))
-        ]
+        # Cached: the streak, volatility and recent-window stats all walk it.
+        r = self.ratings
+        return list(map(sub, r[1:], r))
 
-    def _count_recent(self, days: int) -> Dict[str, int]:
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        wins = 0
-        losses = 0
+    @cached_property
+    def _suffix_results(self) -> Tuple[List[int], List[int]]:
+        """Wins/losses over ``mmr_deltas[i:]`` for every i, built in one pass.
 
-        for ts, delta in zip(self.timestamps[1:], self.mmr_deltas):
-            if days != -1 and ts < cutoff:
-                continue
-            if delta > 0:
-                wins += 1
-            elif delta < 0:
-                losses += 1
+        Timestamps are sorted, so every recent-games window is a suffix of the
+        deltas and ``_count_recent`` reduces to a bisect plus two lookups.
+        """
+        deltas = self.mmr_deltas
+        wins = [0] * (len(deltas) + 1)
+        losses = [0] * (len(deltas) + 1)
+        for i in range(len(deltas) - 1, -1, -1):
+            wins[i] = wins[i + 1] + (deltas[i] > 0)
+            losses[i] = losses[i + 1] + (deltas[i] < 0)
+        return wins, losses
+
+    def record(self, days: int) -> Tuple[int, int]:
+        """(wins, losses) over the last ``days`` days; ``-1`` for lifetime."""
+        wins, losses = self._suffix_results
+        if days == -1:
+            start = 0
+        else:
+            cutoff = datetime.utcnow() - timedelta(days=days)
+            # deltas[j] is the game at timestamps[j + 1].
+            start = bisect_left(self.timestamps, cutoff, 1) - 1
+        return wins[start], losses[start]
 
+    def _count_recent(self, days: int) -> Dict[str, int]:
+        wins, losses = self.record(days)
         return {"wins": wins, "losses": losses}
 
     @computed_field
@@ -212,6 +215,6 @@ class TeamHistory(BaseModel):
         bars = "▁▂▃▄▅▆▇█"
         n_levels = len(bars)
 
-        spark = "".join(bars[int(v * (n_levels - 1))] for v in normalized)
+        spark = "".join([bars[int(v * (n_levels - 1))] for v in normalized])
 
         return spark
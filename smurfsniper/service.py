@@ -1,11 +1,11 @@
 import signal
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-import keyboard
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 from PySide6.QtWidgets import QApplication
 
 from smurfsniper.api import cross_network, sc2pulse
@@ -19,8 +19,8 @@ from smurfsniper.analyze.teams import NoTeamFound, TeamAnalysis
 from smurfsniper.enums import TeamFormat
 from smurfsniper.logger import logger
 from smurfsniper.models.config import Config, OverlayPreferences
-from smurfsniper.models.player import Player
-from smurfsniper.models.player_log import PlayerLog, init_player_log_db
+from smurfsniper.models.player import Player, PlayerStats
+from smurfsniper.models.player_log import PlayerLog, db, init_player_log_db
 from smurfsniper.ui.overlay_manager import close_all_overlays
 
 
@@ -46,11 +46,31 @@ class _HintBridge(QObject):
         self.show.connect(external_intel.show_hint_overlay)
 
 
+def _save_player_logs(logs: list[PlayerLog]) -> None:
+    """Insert one postgame's rows in a single transaction (one commit)."""
+    try:
+        with db.atomic():
+            for log in logs:
+                log.save()
+    except Exception as e:  # runs on the writer thread; nothing else would log it
+        logger.error(f"Saving player log failed: {e}")
+
+
 class GamePoller:
-    def __init__(self, url: str, config_path: str):
+    def __init__(self, url: str, config_path: str, config: Config | None = None):
         init_player_log_db()
         self.url = url
-        self.config = Config.from_config_file(config_path)
+        # Kept open for the 5s poll so each tick reuses one keep-alive
+        # connection to the local game API instead of reconnecting.
+        self._http = httpx.Client(timeout=5)
+        # The CLI has already loaded and validated the file (with any
+        # overrides applied); only re-read it when started without one.
+        self.config = config or Config.from_config_file(config_path)
+        # Fixed for the session, so derived once rather than on every game.
+        me = self.config.me
+        self._mmr_min = me.mmr - 500
+        self._mmr_max = me.mmr + 500
+        self._own_names = frozenset((me.name, *self.config.team.members))
         self.previous_state = None
         self.mode = TeamFormat._1V1
         self.player_analysis = None
@@ -61,6 +81,15 @@ class GamePoller:
         self.current_opponents = []
         # Cross-network intel gathered once at game start; reused by Ctrl+F2.
         self.current_intel = []
+        # battlenet_ids already logged for the current game, so repeated
+        # postgame poll ticks don't re-save any opponent. Seeded from the
+        # newest game's rows in case the service restarts on a postgame screen.
+        self._logged_ids = PlayerLog.most_recent_game_ids()
+        # Single writer thread for player-log inserts, so a slow SQLite commit
+        # (e.g. a WAL checkpoint) never stalls the Qt poll timer.
+        self._db_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="player-log"
+        )
         # Bridge so the background scout can show its hint on the Qt thread.
         self._hint_bridge = _HintBridge()
 
@@ -83,6 +112,7 @@ class GamePoller:
         close_all_overlays()
         self.current_opponents = []
         self.current_intel = []
+        self._logged_ids.clear()
         logger.info(f"New game detected: {self.previous_state}")
 
         my_team, opp_team = self._split_teams(players)
@@ -101,18 +131,26 @@ class GamePoller:
 
     def _fetch_game_state(self):
         try:
-            r = httpx.get(self.url, timeout=5)
+            r = self._http.get(self.url)
             r.raise_for_status()
             return r.json()
         except Exception as e:
             logger.error(f"Polling error: {e}")
             return None
 
+    def close(self):
+        self._http.close()
+        # Let queued player-log inserts finish before the process exits.
+        self._db_writer.shutdown(wait=True)
+
     def _is_game_end(self, players) -> bool:
         return any(p.get("result") in {"Victory", "Defeat", "Tie"} for p in players)
 
     def _is_new_game(self, players) -> bool:
-        state = tuple((p.get("name"), p.get("race")) for p in players)
+        # Sorted so a reshuffled player list in the same lobby isn't a new game.
+        state = tuple(
+            sorted((p.get("name") or "", p.get("race") or "") for p in players)
+        )
         if state == self.previous_state:
             return False
         self.previous_state = state
@@ -124,42 +162,51 @@ class GamePoller:
         self.current_opponents = []
         self.current_intel = []
 
-        me = self.config.me
-        teammates = set(self.config.team.members)
-
-        mmr_min = me.mmr - 500
-        mmr_max = me.mmr + 500
-
-        for p in players:
-            name = p.get("name")
-            if name == me.name or name in teammates:
-                continue
+        opponents = [p for p in players if p.get("name") not in self._own_names]
+        if not opponents:
+            return
 
-            player = Player(**p)
+        def lookup(player: Player):
+            # Per-player failures only skip that player's log row.
             try:
-                stats = player.get_player_stats(mmr_min, mmr_max)
+                return player.get_player_stats(self._mmr_min, self._mmr_max)
             except (SC2PulseError, IndexError) as e:
                 logger.warning(f"Could not look up {player.name}: {e}")
-                continue
-
-            most_recent = PlayerLog.most_recent()
-            log = PlayerLog.from_player_stats(
-                stats,
-                match_status=p.get("result").lower(),
+                return None
+
+        # Same fan-out as _fetch_players_stats: one round trip for the team.
+        opp_players = [Player(**p) for p in opponents]
+        with ThreadPoolExecutor(max_workers=len(opp_players)) as pool:
+            opp_stats = list(pool.map(lookup, opp_players))
+
+        pending = [
+            (
+                player.name,
+                PlayerLog.from_player_stats(
+                    stats, match_status=p.get("result").lower()
+                ),
             )
+            for p, player, stats in zip(opponents, opp_players, opp_stats)
+            if stats is not None
+        ]
+        # The duplicate check runs here, against the in-memory ids, so the
+        # next poll tick sees them even while the insert is still queued.
+        to_save = []
+        for name, log in pending:
+            if log.battlenet_id in self._logged_ids:
+                continue
+            logger.info(f"Saving {name} to log.")
+            to_save.append(log)
+            self._logged_ids.add(log.battlenet_id)
 
-            if (
-                not most_recent
-                or most_recent.battlenet_id != stats.members.character.battlenetId
-            ):
-                logger.info(f"Saving {player.name} to log.")
-                log.save()
+        if to_save:
+            self._db_writer.submit(_save_player_logs, to_save)
 
     def _split_teams(self, players):
         my_team, opp_team = [], []
 
         for p in players:
-            if p.get("name") == self.config.me.name or p.get("name") in self.config.team.members:
+            if p.get("name") in self._own_names:
                 my_team.append(p)
             else:
                 opp_team.append(p)
@@ -168,37 +215,40 @@ class GamePoller:
 
     def _handle_1v1(self, opp_raw):
         self.mode = TeamFormat._1V1
+        prefs = self.config.preferences
 
         opp = Player(**opp_raw)
         try:
             stats = opp.get_player_stats(
-                min_mmr=self.config.me.mmr - 500,
-                max_mmr=self.config.me.mmr + 500,
+                min_mmr=self._mmr_min,
+                max_mmr=self._mmr_max,
             )
         except (SC2PulseError, IndexError) as e:
             logger.warning(f"Could not look up {opp.name}: {e}")
             return
 
         self.current_opponents = [stats]
-        self._show_opponent_history(
-            stats, opp, self.config.preferences.overlay_player_log_1
-        )
+        self._show_opponent_history(stats, opp, prefs.overlay_player_log_1)
 
         self.player_analysis = PlayerAnalysis.from_player_stats(stats, player=opp)
 
         logger.info(f"Detected 1v1 opponent: {opp.name}")
         two_tone_chime()
-        logger.info(self.player_analysis.summary())
 
         self.player_analysis.show_overlay(
-            duration_seconds=self.config.preferences.overlay_1v1.seconds_visible,
-            orientation=self.config.preferences.overlay_1v1.orientation,
-            position=self.config.preferences.overlay_1v1.position,
-            delay_seconds=self.config.preferences.overlay_1v1.seconds_delay_before_show,
+            duration_seconds=prefs.overlay_1v1.seconds_visible,
+            orientation=prefs.overlay_1v1.orientation,
+            position=prefs.overlay_1v1.position,
+            delay_seconds=prefs.overlay_1v1.seconds_delay_before_show,
         )
 
         self._scout_and_hint()
 
+        # Logged last: the overlay builds the same summary (warming the cached
+        # SC2Pulse lookups behind it), so get it on screen and the scout thread
+        # started before formatting the log copy.
+        logger.info(self.player_analysis.summary())
+
     def _scout_and_hint(self):
         """Gather cross-network intel for the current opponents once, cache it
         for Ctrl+F2, and if any opponent has an external footprint play a
@@ -244,17 +294,32 @@ class GamePoller:
         except ValueError:
             logger.info(f"Never played {opp.name} before.")
 
+    @staticmethod
+    def _fetch_players_stats(
+        players: list[Player], min_mmr: int, max_mmr: int
+    ) -> list[PlayerStats]:
+        """Look up every player on SC2Pulse concurrently, preserving order.
+
+        Each lookup is an independent HTTPS round trip, so overlapping them in
+        threads makes a 4v4 cost about one round trip instead of four. The
+        first lookup error is re-raised, same as a serial loop.
+        """
+        if len(players) <= 1:
+            return [p.get_player_stats(min_mmr, max_mmr) for p in players]
+        with ThreadPoolExecutor(max_workers=len(players)) as pool:
+            return list(
+                pool.map(lambda p: p.get_player_stats(min_mmr, max_mmr), players)
+            )
+
     def _handle_2v2(self, opp_team):
         self.mode = TeamFormat._2V2
+        prefs = self.config.preferences
 
         opp1, opp2 = Player(**opp_team[0]), Player(**opp_team[1])
 
         try:
-            opp1_stats = opp1.get_player_stats(
-                self.config.me.mmr - 500, self.config.me.mmr + 500
-            )
-            opp2_stats = opp2.get_player_stats(
-                self.config.me.mmr - 500, self.config.me.mmr + 500
+            opp1_stats, opp2_stats = self._fetch_players_stats(
+                [opp1, opp2], self._mmr_min, self._mmr_max
             )
         except (SC2PulseError, IndexError):
             logger.warning("Could not find any records for one or more opponents.")
@@ -267,19 +332,15 @@ class GamePoller:
         logger.info(f"Detected 2v2 opponents: {opp1.name}, {opp2.name}")
         two_tone_chime()
 
-        self._show_opponent_history(
-            opp1_stats, opp1, self.config.preferences.overlay_player_log_1
-        )
-        self._show_opponent_history(
-            opp2_stats, opp2, self.config.preferences.overlay_player_log_2
-        )
+        self._show_opponent_history(opp1_stats, opp1, prefs.overlay_player_log_1)
+        self._show_opponent_history(opp2_stats, opp2, prefs.overlay_player_log_2)
 
         self.player_2v2_analysis = Player2v2Analysis(ps1, ps2)
         self.player_2v2_analysis.show_overlay(
-            duration_seconds=self.config.preferences.overlay_2v2.seconds_visible,
-            orientation=self.config.preferences.overlay_2v2.orientation,
-            position=self.config.preferences.overlay_2v2.position,
-            delay_seconds=self.config.preferences.overlay_2v2.seconds_delay_before_show,
+            duration_seconds=prefs.overlay_2v2.seconds_visible,
+            orientation=prefs.overlay_2v2.orientation,
+            position=prefs.overlay_2v2.position,
+            delay_seconds=prefs.overlay_2v2.seconds_delay_before_show,
         )
 
         try:
@@ -287,10 +348,10 @@ class GamePoller:
                 player_stats=[opp1_stats, opp2_stats]
             )
             self.team_analysis.show_overlay(
-                duration_seconds=self.config.preferences.overlay_2v2.seconds_visible,
-                orientation=self.config.preferences.overlay_team.orientation,
-                position=self.config.preferences.overlay_team.position,
-                delay_seconds=self.config.preferences.overlay_team.seconds_delay_before_show,
+                duration_seconds=prefs.overlay_2v2.seconds_visible,
+                orientation=prefs.overlay_team.orientation,
+                position=prefs.overlay_team.position,
+                delay_seconds=prefs.overlay_team.seconds_delay_before_show,
             )
         except NoTeamFound:
             logger.warning(f"No team found for {opp1.name}, {opp2.name}")
@@ -299,15 +360,14 @@ class GamePoller:
 
     def _handle_team_game(self, opp_team):
         self.mode = TeamFormat._3V3 if len(opp_team) == 3 else TeamFormat._4V4
+        prefs = self.config.preferences
 
         try:
-            opp_stats = [
-                Player(**p).get_player_stats(
-                    min_mmr=self.config.me.mmr - 500,
-                    max_mmr=self.config.me.mmr,
-                )
-                for p in opp_team
-            ]
+            opp_stats = self._fetch_players_stats(
+                [Player(**p) for p in opp_team],
+                min_mmr=self._mmr_min,
+                max_mmr=self.config.me.mmr,
+            )
         except (SC2PulseError, IndexError):
             logger.warning("Could not find any records for one or more opponents.")
             return
@@ -316,10 +376,10 @@ class GamePoller:
         try:
             self.team_analysis = TeamAnalysis.from_players_stats(player_stats=opp_stats)
             self.team_analysis.show_overlay(
-                duration_seconds=self.config.preferences.overlay_2v2.seconds_visible,
-                orientation=self.config.preferences.overlay_team.orientation,
-                position=self.config.preferences.overlay_team.position,
-                delay_seconds=self.config.preferences.overlay_2v2.seconds_delay_before_show,
+                duration_seconds=prefs.overlay_2v2.seconds_visible,
+                orientation=prefs.overlay_team.orientation,
+                position=prefs.overlay_team.position,
+                delay_seconds=prefs.overlay_2v2.seconds_delay_before_show,
             )
         except NoTeamFound:
             logger.warning(f"No team found for {opp_stats}")
@@ -346,10 +406,20 @@ class _F2Bridge(QObject):
         external_intel.render_overlay(intels, prefs)
 
 
-def main(url: str, config_file_path: str, app: QApplication | None = None):
+def main(
+    url: str,
+    config_file_path: str,
+    app: QApplication | None = None,
+    config: Config | None = None,
+):
+    # Only the running service installs the global hotkey hook; importing it
+    # at module level would make every import of GamePoller pay for it (and
+    # on Linux the library refuses to load without root).
+    import keyboard
+
     app = app or QApplication.instance() or QApplication([])
     signal.signal(signal.SIGINT, lambda *_: app.quit())
-    poller = GamePoller(url, config_file_path)
+    poller = GamePoller(url, config_file_path, config=config)
 
     integrations = poller.config.integrations
     if integrations and integrations.aligulac:
@@ -393,12 +463,16 @@ def main(url: str, config_file_path: str, app: QApplication | None = None):
     keyboard.add_hotkey("ctrl+f2", on_ctrl_f2)
 
     timer = QTimer()
+    # Whole-second accuracy is plenty for a 5s poll and lets the OS batch
+    # the wakeup with others.
+    timer.setTimerType(Qt.VeryCoarseTimer)
     timer.timeout.connect(poller.poll_once)
     timer.start(5000)
 
     exit_code = app.exec()
 
     keyboard.unhook_all()
+    poller.close()
     sc2pulse.close()
     cross_network.close()
     sys.exit(exit_code)
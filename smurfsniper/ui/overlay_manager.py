@@ -1,24 +1,33 @@
+import shiboken6
+from PySide6.QtCore import QEvent
 from PySide6.QtWidgets import QApplication
 
-OPEN_OVERLAYS = []
+# Strong refs keep parentless overlays alive (PySide deletes the widget when
+# its Python wrapper is collected); entries drop out as soon as Qt destroys
+# the widget, so self-closed overlays don't accumulate between games. A dict
+# is used as an insertion-ordered set so that removal is a plain pop.
+OPEN_OVERLAYS = {}
 
 
 def register_overlay(widget):
-    OPEN_OVERLAYS.append(widget)
+    OPEN_OVERLAYS[widget] = None
+    widget.destroyed.connect(lambda *_: OPEN_OVERLAYS.pop(widget, None))
 
 
 def close_all_overlays():
     app = QApplication.instance()
-    if not app:
+    if not app or not OPEN_OVERLAYS:
         return
 
-    for w in reversed(OPEN_OVERLAYS):
-        try:
-            w.close()
-        except:
-            pass
-
+    widgets = list(OPEN_OVERLAYS)
     OPEN_OVERLAYS.clear()
-
-    for _ in range(15):
-        app.processEvents()
+    for w in widgets:
+        # Skip any widget Qt already deleted behind the registry's back.
+        if not shiboken6.isValid(w):
+            continue
+        w.hide()
+        w.deleteLater()
+
+    # Flush the batched deletes once instead of spinning the event loop.
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
@@ -27,6 +27,13 @@ class Overlay(QWidget):
         line-height: 140%;
     """
 
+    # The shared styles are matched by property from one overlay-level sheet,
+    # so Qt parses them once per overlay instead of once per label.
+    _STYLE_KEYS = {PLAYER_STYLE: "player", TM_STYLE: "teammate"}
+    _STYLESHEET = "".join(
+        f'QLabel[overlayStyle="{key}"] {{{css}}}' for css, key in _STYLE_KEYS.items()
+    )
+
     def __init__(
         self, duration_seconds: int = 40, position: str = "top_center", parent=None
     ):
@@ -49,6 +56,8 @@ class Overlay(QWidget):
         )
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setStyleSheet(self._STYLESHEET)
 
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(10, 10, 10, 10)
@@ -58,9 +67,12 @@ class Overlay(QWidget):
         row = QHBoxLayout()
         row.setSpacing(spacing)
 
+        key = self._STYLE_KEYS.get(style)
         for text in blocks:
             lbl = QLabel(text, self)
-            if style:
+            if key:
+                lbl.setProperty("overlayStyle", key)
+            elif style:
                 lbl.setStyleSheet(style)
             row.addWidget(lbl, 1)
 
@@ -97,8 +109,21 @@ class Overlay(QWidget):
 
         self._position_overlay()
 
-        loop = QEventLoop()
-        QTimer.singleShot(0, loop.quit)
-        loop.exec()
+        # Callers often go straight on to blocking lookups on this thread, so
+        # flush the pending paint now rather than when control returns to Qt.
+        # User input is left queued so it can't re-enter the game handlers.
+        QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+
+        # WA_DeleteOnClose: the auto-close deletes the widget, so the timer is
+        # scoped to it in case close_all_overlays got there first.
+        QTimer.singleShot(self.duration_seconds * 1000, self, self.close)
+
+    def show_after(self, delay_seconds: float):
+        """Show now, or after ``delay_seconds`` when positive."""
+        if delay_seconds <= 0:
+            self.show()
+            return
 
-        QTimer.singleShot(self.duration_seconds * 1000, self.close)
+        # Scoped to the overlay: if close_all_overlays deletes it first, Qt
+        # drops the pending show instead of calling into a dead widget.
+        QTimer.singleShot(int(delay_seconds * 1000), self, self.show)
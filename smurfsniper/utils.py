@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import List
 
 from smurfsniper.enums import Region, TeamFormat, TeamType
@@ -19,7 +20,13 @@ def create_team_legacy_uid(
 def human_friendly_duration(start: datetime, end: datetime | None = None) -> str:
     if end is None:
         end = datetime.utcnow()
+    return _calendar_duration(start.date(), end.date())
 
+
+# Only the calendar dates matter, so results are cached per (start, end) day
+# pair; "now" still moves the key forward instead of freezing the answer.
+@lru_cache(maxsize=1024)
+def _calendar_duration(start: date, end: date) -> str:
     delta_years = end.year - start.year
     delta_months = end.month - start.month
     delta_days = end.day - start.day
@@ -0,0 +1,78 @@
+import os
+import sys
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+import shiboken6
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from smurfsniper.analyze.player_logs import LoggedEncounter, PlayerLogAnalysis
+from smurfsniper.ui import overlay_manager
+from smurfsniper.ui.overlay_manager import close_all_overlays
+from smurfsniper.ui.overlays import Overlay
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def slot_errors(monkeypatch):
+    """Exceptions raised inside Qt callbacks are reported via sys.excepthook
+    rather than propagated, so collect them for the test to assert on."""
+    errors = []
+    monkeypatch.setattr(sys, "excepthook", lambda *exc_info: errors.append(exc_info))
+    return errors
+
+
+def _spin(ms: int) -> None:
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_close_all_overlays_drops_pending_delayed_show(app, slot_errors):
+    analysis = PlayerLogAnalysis.model_construct(
+        logs=[LoggedEncounter("Opponent", "US", datetime(2025, 1, 1), "victory")]
+    )
+    analysis.show_overlay(duration_seconds=1, delay_seconds=0.05)
+    assert overlay_manager.OPEN_OVERLAYS
+
+    close_all_overlays()
+    assert not overlay_manager.OPEN_OVERLAYS
+
+    # Let the delayed show's timer come due after its overlay is gone.
+    _spin(150)
+    assert slot_errors == []
+
+
+def test_self_closed_overlay_leaves_registry(app, slot_errors):
+    ov = Overlay(duration_seconds=0)
+    ov.add_row(["short-lived"], style=Overlay.TM_STYLE)
+    ov.show()
+
+    # The auto-close deletes the widget (WA_DeleteOnClose); its registry
+    # entry must go with it so close_all_overlays never sees a dead wrapper.
+    _spin(50)
+    assert not shiboken6.isValid(ov)
+    assert not overlay_manager.OPEN_OVERLAYS
+
+    close_all_overlays()
+    assert slot_errors == []
+
+
+def test_close_all_overlays_skips_deleted_widgets(app, slot_errors):
+    stale = Overlay(duration_seconds=5)
+    live = Overlay(duration_seconds=5)
+    # Simulate a wrapper left behind after Qt deleted its widget.
+    shiboken6.delete(stale)
+    overlay_manager.OPEN_OVERLAYS[stale] = None
+
+    close_all_overlays()
+    assert not overlay_manager.OPEN_OVERLAYS
+    assert not shiboken6.isValid(live)
+    assert slot_errors == []